@@ -1,5 +1,17 @@
 #!/usr/bin/env python3
 import argparse
+import itertools
+import logging
+import multiprocessing
+import os
+import pickle
+import socket
+import tempfile
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
 
 '''
 This script allows transfer of DNS from an upstream DNS server via AXFR as
@@ -25,17 +37,315 @@ Usage: `./AXFR2Route53.py -f filename -d example.com -z Z1234567891011 -t CNAME`
 
 try:
     import boto3
+    from botocore.config import Config
 except ImportError:
     raise SystemExit("Requires boto3: pip install boto3")
 try:
     from dns import zone as dnszone
-    #from dns import query
-    from dns.rdataclass import *
-    from dns.rdatatype import *
+    from dns import name as dnsname
+    from dns import query
+    from dns.rdataclass import IN
+    from dns.rdatatype import A, AAAA, CNAME, MX, NS, PTR, SPF, SRV, TXT
     from dns.exception import DNSException
 except ImportError:
     raise SystemExit("Requires dnspython: pip install dnspython")
 
+log = logging.getLogger('axfr2route53')
+
+## Route53 allows up to 1000 ResourceRecord elements and 32000 characters
+## of values per ChangeBatch, and UPSERT actions count each value twice
+## (a DELETE and a CREATE)
+MAX_BATCH_RECORDS = 1000
+MAX_BATCH_CHARS = 32000
+UPSERT_WEIGHT = 2
+## Route53 throttles at 5 requests per second per account
+MAX_WORKERS = 3
+MAX_REQUESTS_PER_SECOND = 4
+MAX_COMMENT_LENGTH = 256
+## changes are built by this script in the shape the service model expects,
+## so skip botocore's per-call walk of every ResourceRecord
+CLIENT_CONFIG = Config(retries={'max_attempts': 10, 'mode': 'adaptive'},
+                       parameter_validation=False)
+## seconds allowed for a complete zone transfer
+AXFR_LIFETIME = 300.0
+## zone files smaller than this are parsed in a single process as
+## forking and merging costs more than it saves
+PARALLEL_MIN_BYTES = 4 * 1024 * 1024
+## how often to report parsing progress with -v
+PROGRESS_INTERVAL = 10000
+
+## standard record types supported by Route53
+RDTYPE_MAP = {
+    'A': (A, IN),
+    'AAAA': (AAAA, IN),
+    'CNAME': (CNAME, IN),
+    'MX': (MX, IN),
+    'NS': (NS, IN),
+    'PTR': (PTR, IN),
+    'SPF': (SPF, IN),
+    'TXT': (TXT, IN),
+    'SRV': (SRV, IN),
+}
+
+## fast paths for rdata presentation format, avoiding the generic to_text()
+## TXT and SPF keep str() since Route53 expects the quoted character strings
+RDATA_FORMATTERS = {
+    'A': lambda r: r.address,
+    'AAAA': lambda r: r.address,
+    'CNAME': lambda r: str(r.target),
+    'NS': lambda r: str(r.target),
+    'PTR': lambda r: str(r.target),
+    'MX': lambda r: "{} {}".format(r.preference, r.exchange),
+    'SRV': lambda r: "{} {} {} {}".format(r.priority, r.weight, r.port,
+                                          r.target),
+}
+
+## record sets are emitted in canonical order so repeated runs produce
+## identical changes; values sort as strings unless a key is given here
+RDATA_SORT_KEYS = {
+    'MX': lambda r: (r.preference, r.exchange),
+    'SRV': lambda r: (r.priority, r.weight, r.port, r.target),
+}
+
+## a single Route53 change as passed to change_resource_record_sets
+Change = Dict[str, Any]
+
+
+def paren_depth(line: str, depth: int) -> int:
+    ''' Return the parenthesis depth after a zone file line '''
+    quoted = False
+    escaped = False
+    for char in line:
+        if escaped:
+            escaped = False
+        elif char == '\\':
+            escaped = True
+        elif char == '"':
+            quoted = not quoted
+        elif quoted:
+            continue
+        elif char == ';':
+            break
+        elif char == '(':
+            depth = depth + 1
+        elif char == ')':
+            depth = depth - 1
+    return depth
+
+
+def split_zone(lines, shards, domain):
+    ''' Split zone file lines into roughly equal shards at entry boundaries
+
+    A shard only starts on a line with an explicit owner name outside of a
+    parenthesised block, and is prefixed with the $ORIGIN and $TTL in effect
+    at that point. Returns None when the file can't be split safely.
+    '''
+    target = sum(len(line) for line in lines) // shards
+    result = []
+    current = []
+    size = 0
+    depth = 0
+    origin = dnsname.from_text(domain)
+    directives = {}
+    for line in lines:
+        if depth == 0 and line.startswith('$'):
+            fields = line.split(';', 1)[0].split()
+            keyword = fields[0].upper()
+            if keyword == '$INCLUDE':
+                return None
+            if keyword == '$ORIGIN':
+                ## a relative $ORIGIN is relative to the one before it, so
+                ## shards carry the absolute name rather than the line
+                origin = dnsname.from_text(fields[1], origin)
+                directives[keyword] = "$ORIGIN {}\n".format(origin.to_text())
+            elif keyword == '$TTL':
+                directives[keyword] = line
+        elif (depth == 0 and size >= target and line[:1] not in ' \t;\r\n'):
+            ## every shard needs a default TTL to parse without the
+            ## records that came before it
+            if '$TTL' not in directives:
+                return None
+            result.append(''.join(current))
+            current = list(directives.values())
+            size = 0
+        current.append(line)
+        size = size + len(line)
+        depth = paren_depth(line, depth)
+    result.append(''.join(current))
+    return result
+
+
+def _parse_shard(args):
+    text, domain = args
+    return dnszone.from_text(text, domain, check_origin=False)
+
+
+def parallel_from_file(filename, domain, workers):
+    ''' Parse a zone file across a process pool and merge the results '''
+    if (workers <= 1 or domain is None or
+            os.path.getsize(filename) < PARALLEL_MIN_BYTES):
+        return dnszone.from_file(filename, domain)
+
+    with open(filename) as f:
+        shards = split_zone(f.readlines(), workers, domain)
+    if shards is None or len(shards) == 1:
+        return dnszone.from_file(filename, domain)
+
+    log.info("Parsing zone in %d shards...", len(shards))
+    with multiprocessing.Pool(workers) as pool:
+        zones = pool.map(_parse_shard, [(shard, domain) for shard in shards])
+
+    z = zones[0]
+    for shard_zone in zones[1:]:
+        for name, node in shard_zone.nodes.items():
+            existing = z.nodes.get(name)
+            if existing is None:
+                z.nodes[name] = node
+                continue
+            ## owner names may be repeated further down the file
+            for rdataset in node.rdatasets:
+                existing.find_rdataset(rdataset.rdclass, rdataset.rdtype,
+                                       rdataset.covers,
+                                       create=True).update(rdataset)
+    z.check_origin()
+    return z
+
+
+def iter_changes(z: Any, rdtypevar: Any, domain: str,
+                 recordtype: str) -> Iterator[Change]:
+    ''' Yield one UPSERT change per owner name of the given record type '''
+    fmt = RDATA_FORMATTERS.get(recordtype, str)
+    sort_key = RDATA_SORT_KEYS.get(recordtype)
+    skip_apex = recordtype == 'NS'
+    ## rdatas of a node share one rdataset, so each owner name is contiguous
+    groups = itertools.groupby(z.iterate_rdatas(rdtypevar),
+                               key=lambda item: item[0])
+    for count, (name, group) in enumerate(groups, 1):
+        if count % PROGRESS_INTERVAL == 0:
+            log.debug("Parsed %d %s record sets", count, recordtype)
+        name_str = str(name)
+        is_apex = name_str == "@"
+        ## we don't want to clobber Route53 NS records
+        ## as we're replacing those NS for Route53
+        if is_apex and skip_apex:
+            log.info("Skipping NS record @")
+            continue
+        if is_apex:
+            recordname = domain + "."
+        else:
+            recordname = name_str + "." + domain + "."
+        rdatas = list(group)
+        ttl = rdatas[0][1]
+        if sort_key is None:
+            values = sorted(fmt(rdata) for _, _, rdata in rdatas)
+        else:
+            values = [fmt(rdata) for rdata in
+                      sorted((rdata for _, _, rdata in rdatas), key=sort_key)]
+        yield {'Action': 'UPSERT',
+               'ResourceRecordSet': {
+                   'Name': recordname,
+                   'Type': recordtype,
+                   'TTL': ttl,
+                   'ResourceRecords': [{'Value': value} for value in values]
+                   }
+               }
+
+
+def change_weight(change: Change) -> Tuple[int, int]:
+    ''' Return the (ResourceRecord, character) count a change uses in a batch '''
+    values = change['ResourceRecordSet']['ResourceRecords']
+    records = len(values)
+    chars = sum(len(r['Value']) for r in values)
+    if change['Action'] == 'UPSERT':
+        return records * UPSERT_WEIGHT, chars * UPSERT_WEIGHT
+    return records, chars
+
+
+def filter_oversized(changes: Iterable[Change],
+                     skipped: Counter) -> Iterator[Change]:
+    ''' Drop changes that could never fit in a single ChangeBatch '''
+    for change in changes:
+        records, chars = change_weight(change)
+        if records > MAX_BATCH_RECORDS or chars > MAX_BATCH_CHARS:
+            rrset = change['ResourceRecordSet']
+            log.warning("record %s exceeds Route53 ChangeBatch limits "
+                        "(%d/%d weighted records, %d/%d weighted characters), "
+                        "skipping", rrset['Name'], records, MAX_BATCH_RECORDS,
+                        chars, MAX_BATCH_CHARS)
+            skipped['oversized'] += 1
+            continue
+        yield change
+
+
+def pack_changes(changes: Iterable[Change], limit: int = MAX_BATCH_RECORDS,
+                 char_limit: int = MAX_BATCH_CHARS) -> Iterator[List[Change]]:
+    ''' Greedily pack changes into batches by weighted ResourceRecord count '''
+    batch: List[Change] = []
+    count = 0
+    size = 0
+    for change in changes:
+        records, chars = change_weight(change)
+        if batch and (count + records > limit or size + chars > char_limit):
+            yield batch
+            batch = []
+            count = 0
+            size = 0
+        batch.append(change)
+        count = count + records
+        size = size + chars
+    if batch:
+        yield batch
+
+
+def route53_name(name: str) -> str:
+    ''' Normalize a record name the way Route53 returns it '''
+    return name.lower().replace('*', '\\052')
+
+
+def existing_records(client, hostedzone, recordtype):
+    ''' Map (Name, Type) to (TTL, sorted values) for records in the zone '''
+    existing = {}
+    paginator = client.get_paginator('list_resource_record_sets')
+    pages = paginator.paginate(HostedZoneId=str(hostedzone),
+                               PaginationConfig={'PageSize': 300})
+    for page in pages:
+        for rrset in page['ResourceRecordSets']:
+            if rrset['Type'] != recordtype:
+                continue
+            values = sorted(r['Value'] for r in rrset.get('ResourceRecords', []))
+            existing[(rrset['Name'], rrset['Type'])] = (rrset.get('TTL'), values)
+    return existing
+
+
+def filter_unchanged(changes: Iterable[Change],
+                     existing: Dict[Tuple[str, str], Tuple[Any, List[str]]],
+                     skipped: Counter) -> Iterator[Change]:
+    ''' Drop changes whose record set already matches Route53 '''
+    for change in changes:
+        rrset = change['ResourceRecordSet']
+        current = existing.get((route53_name(rrset['Name']), rrset['Type']))
+        if current == (rrset['TTL'],
+                       sorted(r['Value'] for r in rrset['ResourceRecords'])):
+            skipped['unchanged'] += 1
+            continue
+        yield change
+
+
+class RateLimiter(object):
+    ''' Space out calls shared across threads to a fixed rate. '''
+    def __init__(self, rate):
+        self.interval = 1.0 / rate
+        self.next_ok = time.monotonic()
+        self.lock = threading.Lock()
+
+    def wait(self):
+        ''' Block until the next call is allowed '''
+        with self.lock:
+            sleep_for = self.next_ok - time.monotonic()
+            if sleep_for > 0:
+                time.sleep(sleep_for)
+            self.next_ok = time.monotonic() + self.interval
+
 
 class AXFR2Route53(object):
     ''' Update Route53 with entries from upstream DNS Server. '''
@@ -43,6 +353,50 @@ class AXFR2Route53(object):
         self.options = options
         self.update_records()
 
+    def transfer_zone(self, server, domain):
+        ''' Build the zone directly from an AXFR response '''
+        try:
+            address = socket.getaddrinfo(server, 53)[0][4][0]
+            return dnszone.from_xfr(
+                query.xfr(address, domain, lifetime=AXFR_LIFETIME))
+        except (DNSException, OSError, EOFError) as e:
+            raise SystemExit("AXFR request to {} failed: {}".format(server, e))
+
+    def load_zone(self, filename, domain):
+        ''' Parse the zone file, reusing a pickled copy when --cache is set '''
+        if not self.options.cache:
+            return parallel_from_file(filename, domain, self.options.jobs)
+
+        cache_path = filename + ".pkl"
+        ## key on the exact file state so a zone file replaced with an
+        ## older mtime (cp -p, rsync -t) still invalidates the cache
+        stat = os.stat(filename)
+        key = (domain, stat.st_mtime_ns, stat.st_size)
+        if os.path.exists(cache_path):
+            try:
+                with open(cache_path, 'rb') as f:
+                    cached_key, z = pickle.load(f)
+            except (pickle.UnpicklingError, EOFError, ValueError):
+                log.info("Ignoring unreadable cache: %s", cache_path)
+            else:
+                if cached_key == key:
+                    log.info("Using cached zone: %s", cache_path)
+                    return z
+
+        z = parallel_from_file(filename, domain, self.options.jobs)
+        ## write to a temporary file first so an interrupted run never
+        ## leaves a truncated cache behind
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path) or '.',
+                                        suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump((key, z), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return z
+
     def update_records(self):
         ''' Run route53 updates based on AXFR request '''
 
@@ -51,156 +405,116 @@ class AXFR2Route53(object):
         _hostedzone = self.options.hostedzone
         _recordtype = self.options.recordtype
 
-        ## commented this AXFR block while working on file import
-        ## will need to be extended to support either option
-        #try:
-        #    print("Making AXFR request to " + self.options.dns_server + "...")
-        #except TypeError:
-        #    raise SystemExit("No DNS server set. try again with -s to set the "
-        #                     "server to make the AXFR request against.")
-
-        try:
-            print()
-            print("Importing zone from file: {}".format(_filename))
-        except TypeError:
-            raise SystemExit("No filename defined. Use -f to define the path to the zone file.")
-
-        try:
-            z = dnszone.from_file(_filename, _domain)
-        except AttributeError:
+        if _domain is None:
             raise SystemExit("No domain defined. Use -d to define the domain to transfer.")
 
+        if self.options.dns_server is not None:
+            log.info("Making AXFR request to %s...", self.options.dns_server)
+            z = self.transfer_zone(self.options.dns_server, _domain)
+        elif _filename is not None:
+            log.info("Importing zone from file: %s", _filename)
+            z = self.load_zone(_filename, _domain)
+        else:
+            raise SystemExit("No DNS server or filename defined. Use -s to set the "
+                             "server to make the AXFR request against or -f to "
+                             "define the path to the zone file.")
+
         if _hostedzone is None:
             raise SystemExit("No Hosted Zone ID provided. Try again with -z.")
 
-        dns_changes = []
-        adict = {}
-        print("Processing {} records for {}...".format(str(_recordtype), str(_domain)))
-        print()
+        log.info("Processing %s records for %s...", _recordtype, _domain)
 
         if len(z.nodes) == 0:
             raise SystemExit("No records found to process.\n")
 
-        print("Total records downloaded: " + str(len(z.nodes)))
-
-        ## standard record types
-        if _recordtype == "A":
-            rdtypevar = A
-            rdclassvar = IN
-        elif _recordtype == "AAAA":
-            rdtypevar = AAAA
-            rdclassvar = IN
-        elif _recordtype == "CNAME":
-            rdtypevar = CNAME
-            rdclassvar = IN
-        elif _recordtype == "MX":
-            rdtypevar = MX
-            rdclassvar = IN
-        elif _recordtype == "NS":
-            rdtypevar = NS
-            rdclassvar = IN
-        elif _recordtype == "PTR":
-            rdtypevar = PTR
-            rdclassvar = IN
-        elif _recordtype == "SPF":
-            rdtypevar = SPF
-            rdclassvar = IN
-        elif _recordtype == "TXT":
-            rdtypevar = TXT
-            rdclassvar = IN
-        elif _recordtype == "SRV":
-            rdtypevar = SRV
-            rdclassvar = IN
-        else:
-            raise SystemExit("Unknown or unsupported record type in Route 53: ".format(_recordtype))
-
-        ## parse records and build dictionary
-        for name, node in z.nodes.items():
-            rdataset = None
-            rdataset = node.get_rdataset(
-                rdclass=rdclassvar, rdtype=rdtypevar)
-            if not rdataset:
-                continue
-            for rds in rdataset:
-                ## we don't want to clobber Route53 NS records
-                ## as we're replacing those NS for Route53
-                if str(name) == "@" and _recordtype == 'NS':
-                    print("Skipping NS record @")
-                    continue
-                ## build dictionary of records
-                if str(name) == "@":
-                    recordname = _domain + "."
-                    if recordname in adict:
-                        ipaddr = str(rds)
-                        adict[recordname]['records'].append(ipaddr)
-                    else:
-                        ipaddr = str(rds)
-                        adict[recordname] = {'records': [ipaddr]}
-                        adict[recordname].update({'ttl': str(rdataset.ttl)})
-                else:
-                    recordname = str(name) + "." + _domain + "."
-                    if recordname in adict:
-                        ipaddr = str(rds)
-                        adict[recordname]['records'].append(ipaddr)
-                    else:
-                        ipaddr = str(rds)
-                        adict[recordname] = {'records': [ipaddr]}
-                        adict[recordname].update({'ttl': str(rdataset.ttl)})
-
-        ## process the changes
-        for key, thedict in adict.items():
-            ResourceRecordList = []
-            for record in thedict['records']:
-                ResourceRecordList.append({'Value': record})
-            dns_changes.append({'Action': 'UPSERT',
-                                'ResourceRecordSet': {
-                                    'Name': key,
-                                    'Type': _recordtype,
-                                    'TTL': int(thedict['ttl']),
-                                    'ResourceRecords': ResourceRecordList
-                                    }
-                                })
-        if len(dns_changes) == 0:
-            raise SystemExit("No " + _recordtype + " records found.")
+        log.info("Total records downloaded: %d", len(z.nodes))
 
-        print("Total records processed: " + str(len(dns_changes)))
+        try:
+            rdtypevar, rdclassvar = RDTYPE_MAP[_recordtype]
+        except KeyError:
+            raise SystemExit("Unknown or unsupported record type in Route 53: {}".format(_recordtype))
+
+        ## zones are single-class, so filter on class up front
+        if z.rdclass != rdclassvar:
+            raise SystemExit("Unsupported zone class for {} records.".format(_recordtype))
 
         # connecting to route53 via boto
-        print("Connecting to Route53...")
-
-        ## submit changes to route53 in batches
-        client = boto3.client('route53')
-        if len(dns_changes) > 98:
-            print("Batching required...")
-            chunks = [dns_changes[x:x+98] for x in range(0, len(dns_changes), 98)]
-            chunkcount = 0
-            for chunk in chunks:
-                chunkcount = chunkcount + 1
-                client.change_resource_record_sets(
-                    HostedZoneId=str(_hostedzone),
-                    ChangeBatch={'Changes': chunk})
-                print("Batch " + str(chunkcount) + " submitted to Route53")
-        else:
+        log.info("Connecting to Route53...")
+        client = boto3.client('route53', config=CLIENT_CONFIG)
+
+        ## skip records that already match what is in route53
+        existing = existing_records(client, _hostedzone, _recordtype)
+        skipped = Counter()
+
+        ## parse records lazily into route53 batches
+        changes = filter_oversized(
+            iter_changes(z, rdtypevar, _domain, _recordtype), skipped)
+        batches = pack_changes(filter_unchanged(changes, existing, skipped))
+        first = next(batches, None)
+        if first is None:
+            if skipped:
+                log.info("Total records unchanged: %d", skipped['unchanged'])
+                log.info("Total records too large: %d", skipped['oversized'])
+                log.info("No changes to submit to Route53")
+                return
+            raise SystemExit("No " + _recordtype + " records found.")
+
+        ## submit changes to route53 in batches, staying under the
+        ## account-wide rate limit so the adaptive retrier rarely kicks in
+        limiter = RateLimiter(MAX_REQUESTS_PER_SECOND)
+
+        def submit(batch, sequence):
+            ## tag each batch so a failed change can be traced in CloudTrail
+            ## shorten the user's comment rather than losing the suffix
+            suffix = " [{}]".format(sequence)
+            comment = (self.options.comment[:MAX_COMMENT_LENGTH - len(suffix)] +
+                       suffix)
+            limiter.wait()
             client.change_resource_record_sets(
                 HostedZoneId=str(_hostedzone),
-                ChangeBatch={'Changes': dns_changes})
-            print("Changes submitted to Route53")
-            print()
+                ChangeBatch={'Comment': comment, 'Changes': batch})
+            return len(batch)
+
+        ## each owner name is yielded once for the single record type being
+        ## synced, so no name/type pair spans two batches and batches can be
+        ## applied concurrently without conflicting with each other
+        processed = 0
+        batchcount = 0
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            ## keep at most one batch queued per worker in memory
+            pending = deque()
+            for sequence, batch in enumerate(
+                    itertools.chain([first], batches), 1):
+                pending.append(executor.submit(submit, batch, sequence))
+                if len(pending) > MAX_WORKERS:
+                    processed = processed + pending.popleft().result()
+                    batchcount = batchcount + 1
+                    log.info("Batch %d submitted to Route53", batchcount)
+            while pending:
+                processed = processed + pending.popleft().result()
+                batchcount = batchcount + 1
+                log.info("Batch %d submitted to Route53", batchcount)
+
+        log.info("Total records processed: %d", processed)
+        log.info("Total records unchanged: %d", skipped['unchanged'])
+        log.info("Total records too large: %d", skipped['oversized'])
+        log.info("Changes submitted to Route53")
 
 
 def parser_setup():
     ''' Setup the options parser '''
-    desc = 'Import zone file resource records and submit to Route53 zoneID.'
+    desc = ('Import resource records via AXFR or from a zone file and '
+            'submit to Route53 zoneID.')
     parser = argparse.ArgumentParser(description=desc)
     parser.add_argument('-d',
                         action='store',
                         dest='domain',
                         help='Domain to submit AXFR request for')
-    #parser.add_argument('-s',
-    #                    action='store',
-    #                    dest='dns_server',
-    #                    help='DNS server to send AXFR request to. '
-    #                         'FQDN is allowed. This ia required.')
+    parser.add_argument('-s',
+                        action='store',
+                        dest='dns_server',
+                        help='DNS server to send AXFR request to. '
+                             'FQDN is allowed. Takes precedence over -f.')
     parser.add_argument('-t',
                         action='store',
                         dest='recordtype',
@@ -210,11 +524,27 @@ def parser_setup():
                         action='store',
                         dest='filename',
                         help='Import zone from file path.')
+    parser.add_argument('--cache',
+                        action='store_true',
+                        dest='cache',
+                        help='Cache the parsed zone next to the zone file '
+                             'and reuse it while the file is unchanged.')
+    parser.add_argument('-j', '--jobs',
+                        action='store',
+                        dest='jobs',
+                        type=int,
+                        default=1,
+                        help='Number of processes used to parse large '
+                             'zone files.')
     parser.add_argument('-c',
                         action='store',
                         dest='comment',
                         default='Managed by AXFR2Route53.py',
                         help='Set Route53 record comment.')
+    parser.add_argument('-v',
+                        action='store_true',
+                        dest='verbose',
+                        help='Log debug output such as parsing progress.')
     parser.add_argument('-z',
                         action='store',
                         dest='hostedzone',
@@ -227,6 +557,11 @@ def main():
     ''' Setup options and call main program '''
     parser = parser_setup()
     options = parser.parse_args()
+    ## only configure our own logger so -v doesn't turn on botocore debugging
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    log.addHandler(handler)
+    log.setLevel(logging.DEBUG if options.verbose else logging.INFO)
     AXFR2Route53(options)
 
 
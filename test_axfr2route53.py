@@ -0,0 +1,88 @@
+import argparse
+import os
+
+import pytest
+from dns import zone as dnszone
+
+import axfr2route53
+
+DOMAIN = 'example.com'
+HEADER = ("$TTL 300\n"
+          "@ IN SOA ns1 hostmaster (\n"
+          "    1 ; serial\n"
+          "    3600 900 604800 300 )\n"
+          "@ IN NS ns1\n"
+          "ns1 IN A 10.0.0.1\n")
+
+
+@pytest.fixture(autouse=True)
+def always_parallel(monkeypatch):
+    monkeypatch.setattr(axfr2route53, 'PARALLEL_MIN_BYTES', 0)
+
+
+def assert_parallel_matches(tmp_path, text, workers=4):
+    path = tmp_path / 'example.com.zone'
+    path.write_text(text)
+    shards = axfr2route53.split_zone(text.splitlines(True), workers, DOMAIN)
+    assert shards is not None and len(shards) > 1
+    expected = dnszone.from_file(str(path), DOMAIN)
+    assert axfr2route53.parallel_from_file(str(path), DOMAIN, workers) == expected
+
+
+def test_relative_origin(tmp_path):
+    text = HEADER + "$ORIGIN sub\n"
+    text += "".join("a{} IN A 10.1.0.{}\n".format(i, i) for i in range(50))
+    text += "$ORIGIN deeper\n"
+    text += "".join("b{} IN A 10.2.0.{}\n".format(i, i) for i in range(50))
+    assert_parallel_matches(tmp_path, text)
+
+
+def test_ttl_changes(tmp_path):
+    text = HEADER
+    for ttl in (60, 120, 240, 480):
+        text += "$TTL {}\n".format(ttl)
+        text += "".join("t{}-{} IN A 10.3.0.{}\n".format(ttl, i, i)
+                        for i in range(25))
+    assert_parallel_matches(tmp_path, text)
+
+
+def test_multiline_records(tmp_path):
+    text = HEADER
+    for i in range(60):
+        text += ("m{} IN TXT ( \"one ( ; not a comment\"\n"
+                 "    \"two\" ) ; comment (\n"
+                 "    IN A 10.4.0.{}\n").format(i, i)
+    assert_parallel_matches(tmp_path, text)
+
+
+def test_owner_repeated_across_shards(tmp_path):
+    text = HEADER
+    text += "".join("r{} IN A 10.5.0.{}\n".format(i, i) for i in range(100))
+    text += "".join("r0 IN A 10.6.0.{}\n".format(i) for i in range(100))
+    assert_parallel_matches(tmp_path, text)
+
+
+def load_cached(path):
+    ## skip __init__, which would go on to submit the zone to Route53
+    loader = axfr2route53.AXFR2Route53.__new__(axfr2route53.AXFR2Route53)
+    loader.options = argparse.Namespace(cache=True, jobs=1)
+    return loader.load_zone(str(path), DOMAIN)
+
+
+def test_cache_recovers_from_truncated_pickle(tmp_path):
+    path = tmp_path / 'example.com.zone'
+    path.write_text(HEADER)
+    cache = tmp_path / 'example.com.zone.pkl'
+    cache.write_bytes(b'\x80\x05\x95')
+    assert load_cached(path) == dnszone.from_file(str(path), DOMAIN)
+    assert load_cached(path) == dnszone.from_file(str(path), DOMAIN)
+
+
+def test_cache_invalidated_by_older_zone_file(tmp_path):
+    path = tmp_path / 'example.com.zone'
+    path.write_text(HEADER)
+    load_cached(path)
+    stat = os.stat(str(path))
+    path.write_text(HEADER + "www IN A 10.7.0.1\n")
+    os.utime(str(path), ns=(stat.st_atime_ns, stat.st_mtime_ns - 10 ** 9))
+    assert load_cached(path) == dnszone.from_file(str(path), DOMAIN)